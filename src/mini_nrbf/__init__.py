@@ -11,21 +11,23 @@ Binary Format: <https://msdn.microsoft.com/en-us/library/cc236844.aspx>
 
 from __future__ import annotations
 
+import array
 import dataclasses
 import enum
 import io
+import os
 import pathlib
 import struct
 import typing as t
 
 if t.TYPE_CHECKING:
     import collections.abc as cabc
-    import os
 
     Buffer: t.TypeAlias = bytes | bytearray | memoryview
     StrPath: t.TypeAlias = os.PathLike[str] | str
 
 __all__ = [
+    "MESSAGE_END",
     "BinaryObjectString",
     "DNBinary",
     "MessageEnd",
@@ -44,8 +46,17 @@ __all__ = [
     "load_bytes",
     "load_file",
     "load_stream",
+    "load_string_table",
 ]
 
+_T = t.TypeVar("_T")
+
+_U8 = struct.Struct("<B")
+_I32 = struct.Struct("<i")
+_HEADER = struct.Struct("<iiii")
+_HEADER_RECORD = struct.Struct("<Biiii")
+_STRING_RECORD = struct.Struct("<Bi")
+
 
 @dataclasses.dataclass(slots=True)
 class SerializedStreamHeader:
@@ -70,24 +81,120 @@ class MessageEnd:
     """Represents a message end record."""
 
 
+# MessageEnd carries no data, so the parser returns this shared instance.
+MESSAGE_END = MessageEnd()
+
+
 RecordItem: t.TypeAlias = (
     SerializedStreamHeader | BinaryObjectString | MessageEnd
 )
 
 
 class StreamReader(t.Protocol):
-    def read(self, size: int | None = -1, /) -> bytes: ...
+    def read(self, size: int | None = -1, /) -> Buffer: ...
 
 
 class StreamWriter(t.Protocol):
     def write(self, data: Buffer, /) -> int: ...
 
 
+class _BytesCursor:
+    """Zero-copy reader over an in-memory buffer."""
+
+    __slots__ = ("buf", "pos")
+
+    def __init__(self, data: Buffer) -> None:
+        self.buf: memoryview = memoryview(data).cast("B")
+        self.pos: int = 0
+
+    def read(self, size: int | None = -1, /) -> memoryview:
+        """Read up to `size` bytes as a view into the buffer."""
+        pos = self.pos
+
+        if size is None or size < 0:
+            size = len(self.buf) - pos
+
+        self.pos = pos + size
+        return self.buf[pos : pos + size]
+
+
+def _decode_leb128(buf: memoryview, pos: int) -> tuple[int, int]:
+    """Decode a 7-bit encoded length starting at `pos` in `buf`.
+
+    Returns the decoded length and the position just past its prefix.
+    """
+    try:
+        byte = buf[pos]
+        length = byte & 0x7F
+        shift = 7
+
+        while byte & 0x80:
+            if shift == 35:
+                msg = f"Variable Length ({length}) exceeds maximum size"
+                raise RuntimeError(msg)
+
+            pos += 1
+            byte = buf[pos]
+            length |= (byte & 0x7F) << shift
+            shift += 7
+    except IndexError:
+        raise EOFError from None
+
+    return length, pos + 1
+
+
+def _encode_leb128(length: int) -> bytes:
+    """Encode `length` as a 7-bit encoded length prefix."""
+    if length < 0x80:
+        return bytes((length,))
+
+    if length < 0x4000:
+        return bytes(((length & 0x7F) | 0x80, length >> 7))
+
+    if length < 0x200000:
+        return bytes(
+            (
+                (length & 0x7F) | 0x80,
+                ((length >> 7) & 0x7F) | 0x80,
+                length >> 14,
+            )
+        )
+
+    if length < 0x10000000:
+        return bytes(
+            (
+                (length & 0x7F) | 0x80,
+                ((length >> 7) & 0x7F) | 0x80,
+                ((length >> 14) & 0x7F) | 0x80,
+                length >> 21,
+            )
+        )
+
+    if length < 0x800000000:
+        return bytes(
+            (
+                (length & 0x7F) | 0x80,
+                ((length >> 7) & 0x7F) | 0x80,
+                ((length >> 14) & 0x7F) | 0x80,
+                ((length >> 21) & 0x7F) | 0x80,
+                length >> 28,
+            )
+        )
+
+    msg = f"Variable Length ({length}) exceeds maximum size"
+    raise RuntimeError(msg)
+
+
 class PrimitiveStream:
+    __slots__ = ("_cursor", "stream")
+
     def __init__(self, stream: StreamReader) -> None:
         self.stream: StreamReader = stream
+        self._cursor: _BytesCursor | None = (
+            stream if isinstance(stream, _BytesCursor) else None
+        )
 
-    def read(self, size: int) -> bytes:
+    def read(self, size: int) -> Buffer:
         """Read `size` bytes from the stream."""
         rdbytes = self.stream.read(size)
 
@@ -99,39 +206,86 @@ class PrimitiveStream:
     # 2.1.1 Common Data Types
     def byte(self) -> int:
         """Read an unsigned 8-bit integer."""
-        return struct.unpack("<B", self.read(1))[0]
+        cursor = self._cursor
+
+        if cursor is not None:
+            pos = cursor.pos
+
+            try:
+                value = cursor.buf[pos]
+            except IndexError:
+                raise EOFError from None
+
+            cursor.pos = pos + 1
+            return value
+
+        return self.read(1)[0]
 
     def int32(self) -> int:
         """Read a signed 32-bit integer."""
-        return struct.unpack("<i", self.read(4))[0]
+        cursor = self._cursor
+
+        if cursor is not None:
+            pos = cursor.pos
+
+            try:
+                (value,) = _I32.unpack_from(cursor.buf, pos)
+            except struct.error:
+                raise EOFError from None
+
+            cursor.pos = pos + 4
+            return value
+
+        return _I32.unpack(self.read(4))[0]
 
     # 2.1.1.6 Length Prefixed String
     def string(self) -> str:
         """Read a length-prefixed string."""
-        length = 0
-        shift = 0
+        cursor = self._cursor
 
-        for i in range(5):
-            byte = self.byte()
-            length += (byte & ~0x80) << shift
-            shift += 7
+        if cursor is not None:
+            buf = cursor.buf
+            length, pos = _decode_leb128(buf, cursor.pos)
+            end = pos + length
 
-            if not byte & 0x80:
-                break
+            if end > len(buf):
+                raise EOFError
+
+            cursor.pos = end
+            return str(buf[pos:end], "utf-8")
 
-            if i == 4:
+        read = self.read
+        byte = read(1)[0]
+        length = byte & 0x7F
+        shift = 7
+
+        while byte & 0x80:
+            if shift == 35:
                 msg = f"Variable Length ({length}) exceeds maximum size"
                 raise RuntimeError(msg)
 
-        raw = self.read(length)
-        return raw.decode("u8")
+            byte = read(1)[0]
+            length |= (byte & 0x7F) << shift
+            shift += 7
+
+        raw = read(length)
+        return str(raw, "utf-8")
 
 
 class PrimitiveWriter:
     """Stream writer for primitive NRBF data types."""
 
-    def __init__(self, stream: StreamWriter) -> None:
-        self.stream: StreamWriter = stream
+    __slots__ = ("_write", "stream")
+
+    def __init__(self, stream: StreamWriter | bytearray) -> None:
+        self.stream: StreamWriter | bytearray = stream
+        self._write: cabc.Callable[[Buffer], object] = (
+            stream.extend if isinstance(stream, bytearray) else stream.write
+        )
+
+    def write(self, data: Buffer) -> None:
+        """Write raw bytes to the stream."""
+        _ = self._write(data)
 
     def byte(self, value: int) -> None:
         """Write an unsigned 8-bit integer."""
@@ -139,24 +293,21 @@ class PrimitiveWriter:
             msg = f"Byte value {value} out of range"
             raise ValueError(msg)
 
-        _ = self.stream.write(struct.pack("<B", value))
+        _ = self._write(_U8.pack(value))
 
     def int32(self, value: int) -> None:
         """Write a signed 32-bit integer."""
-        _ = self.stream.write(struct.pack("<i", value))
+        _ = self._write(_I32.pack(value))
 
     def string(self, value: str) -> None:
         """Write a length-prefixed string."""
-        encoded = value.encode("u8")
-        length = len(encoded)
-
-        while length >= 0x80:
-            self.byte((length & 0x7F) | 0x80)
-            length >>= 7
+        self.encoded_string(value.encode("utf-8"))
 
-        self.byte(length & 0x7F)
-
-        _ = self.stream.write(encoded)
+    def encoded_string(self, encoded: Buffer) -> None:
+        """Write a length-prefixed string from raw UTF-8 bytes."""
+        write = self._write
+        _ = write(_encode_leb128(len(encoded)))
+        _ = write(encoded)
 
 
 @enum.unique
@@ -168,120 +319,287 @@ class RecordTypeEnum(enum.IntEnum):
     @classmethod
     def from_record(cls, record: RecordItem) -> RecordTypeEnum:
         """Get the record type enum from a record instance."""
-        match record:
-            case SerializedStreamHeader():
-                return cls.SerializedStreamHeader
-            case BinaryObjectString():
-                return cls.BinaryObjectString
-            case MessageEnd():
-                return cls.MessageEnd
+        record_type = _RECORD_TYPES.get(type(record))
+
+        if record_type is None:
+            record_type = _lookup_record_type(_RECORD_TYPES, record)
+
+        return record_type
 
     def parse(self, stream: RecordStream) -> RecordItem:
-        match self:
-            case self.SerializedStreamHeader:
-                return SerializedStreamHeader(
-                    root_id=stream.int32(),
-                    header_id=stream.int32(),
-                    major_version=stream.int32(),
-                    minor_version=stream.int32(),
-                )
-            case self.BinaryObjectString:
-                return BinaryObjectString(
-                    object_id=stream.int32(), value=stream.string()
-                )
-            case self.MessageEnd:
-                return MessageEnd()
+        return _PARSERS[self](stream)
 
     @classmethod
     def serialize(cls, record: RecordItem, writer: RecordWriter) -> None:
         """Serialize a record to the writer stream."""
-        record_id = cls.from_record(record).value
-        writer.writer.byte(record_id)
-
-        match record:
-            case SerializedStreamHeader():
-                writer.writer.int32(record.root_id)
-                writer.writer.int32(record.header_id)
-                writer.writer.int32(record.major_version)
-                writer.writer.int32(record.minor_version)
-            case BinaryObjectString():
-                writer.writer.int32(record.object_id)
-                writer.writer.string(record.value)
-            case MessageEnd():
-                # MessageEnd has no additional data.
-                pass
+        writer.record(record)
+
+
+def _parse_serialized_stream_header(
+    stream: RecordStream,
+) -> SerializedStreamHeader:
+    return SerializedStreamHeader(*_HEADER.unpack(stream.read(16)))
+
+
+def _parse_binary_object_string(stream: RecordStream) -> BinaryObjectString:
+    return BinaryObjectString(stream.int32(), stream.string())
+
+
+def _parse_message_end(stream: RecordStream) -> MessageEnd:
+    return MESSAGE_END
+
+
+def _encode_serialized_stream_header(record: SerializedStreamHeader) -> bytes:
+    return _HEADER_RECORD.pack(
+        0,  # RecordTypeEnum.SerializedStreamHeader
+        record.root_id,
+        record.header_id,
+        record.major_version,
+        record.minor_version,
+    )
+
+
+def _encode_binary_object_string(record: BinaryObjectString) -> bytes:
+    encoded = record.value.encode("utf-8")
+    return (
+        # RecordTypeEnum.BinaryObjectString
+        _STRING_RECORD.pack(6, record.object_id)
+        + _encode_leb128(len(encoded))
+        + encoded
+    )
+
+
+def _encode_message_end(record: MessageEnd) -> bytes:
+    # MessageEnd has no additional data.
+    return b"\x0b"  # RecordTypeEnum.MessageEnd
+
+
+# Record class -> record type, record type byte -> parser, and
+# record class -> encoder. Encoders return a whole record, type byte
+# included, so that each record goes out in a single write.
+_RECORD_TYPES: dict[type, RecordTypeEnum] = {
+    SerializedStreamHeader: RecordTypeEnum.SerializedStreamHeader,
+    BinaryObjectString: RecordTypeEnum.BinaryObjectString,
+    MessageEnd: RecordTypeEnum.MessageEnd,
+}
+_PARSERS: dict[int, cabc.Callable[[RecordStream], RecordItem]] = {
+    RecordTypeEnum.SerializedStreamHeader: _parse_serialized_stream_header,
+    RecordTypeEnum.BinaryObjectString: _parse_binary_object_string,
+    RecordTypeEnum.MessageEnd: _parse_message_end,
+}
+_ENCODERS: dict[type, cabc.Callable[[t.Any], bytes]] = {
+    SerializedStreamHeader: _encode_serialized_stream_header,
+    BinaryObjectString: _encode_binary_object_string,
+    MessageEnd: _encode_message_end,
+}
+
+
+def _lookup_record_type(table: dict[type, _T], record: object) -> _T:
+    """Look up `record` in `table` by its class or any of its bases."""
+    for cls in type(record).__mro__:
+        value = table.get(cls)
+
+        if value is not None:
+            return value
+
+    msg = f"Unsupported record type: {type(record).__name__}"
+    raise TypeError(msg)
 
 
 class RecordStream(PrimitiveStream):
+    __slots__ = ()
+
     def __init__(self, stream: StreamReader) -> None:
         super().__init__(stream)
 
     def record(self) -> RecordItem:
         """Read an entire record from the stream."""
-        record_type = RecordTypeEnum(self.byte())
-        return record_type.parse(self)
+        record_type = self.byte()
+
+        # Check the common record types before falling back to the table.
+        if record_type == 6:  # RecordTypeEnum.BinaryObjectString
+            return BinaryObjectString(self.int32(), self.string())
+
+        if record_type == 11:  # RecordTypeEnum.MessageEnd
+            return MESSAGE_END
+
+        parse = _PARSERS.get(record_type)
+
+        if parse is None:
+            msg = f"{record_type} is not a valid RecordTypeEnum"
+            raise ValueError(msg)
+
+        return parse(self)
 
 
 class RecordWriter:
     """Stream writer for NRBF records."""
 
-    def __init__(self, stream: StreamWriter) -> None:
+    __slots__ = ("writer",)
+
+    def __init__(self, stream: StreamWriter | bytearray) -> None:
         super().__init__()
         self.writer: PrimitiveWriter = PrimitiveWriter(stream)
 
     def record(self, record: RecordItem) -> None:
         """Write an entire record to the stream."""
-        RecordTypeEnum.serialize(record, self)
+        encode = _ENCODERS.get(type(record))
+
+        if encode is None:
+            encode = _lookup_record_type(_ENCODERS, record)
+
+        self.writer.write(encode(record))
 
 
 class DNBinary:
+    __slots__ = ("_records", "stream")
+
     def __init__(self, stream: StreamReader) -> None:
         self.stream: RecordStream = RecordStream(stream)
         self._records: list[RecordItem] = []
 
     def parse(self) -> tuple[RecordItem, ...]:
+        records = self._records
+        append = records.append
+        read_record = self.stream.record
+
         while True:
-            record = self.stream.record()
-            self._records.append(record)
+            record = read_record()
+            append(record)
 
-            if isinstance(record, MessageEnd):
+            if record is MESSAGE_END:
                 break
 
-        return tuple(self._records)
+        return tuple(records)
 
 
 def load_stream(stream: StreamReader) -> tuple[RecordItem, ...]:
-    """Deserialize a given binary stream into a sequence of records."""
-    return DNBinary(stream).parse()
+    """Deserialize a given binary stream into a sequence of records.
+
+    Seekable streams are read ahead and parsed from memory, then left
+    positioned just past the message end. Other streams are read only as
+    far as the message end.
+    """
+    if not (isinstance(stream, io.IOBase) and stream.seekable()):
+        return DNBinary(stream).parse()
+
+    start = stream.tell()
+    cursor = _BytesCursor(stream.read())
+
+    try:
+        return DNBinary(cursor).parse()
+    finally:
+        _ = stream.seek(start + min(cursor.pos, len(cursor.buf)))
 
 
 def load_bytes(data: Buffer) -> tuple[RecordItem, ...]:
     """Deserialize a given buffer into a sequence of records."""
-    stream = io.BytesIO(data)
-    return load_stream(stream)
+    return DNBinary(_BytesCursor(data)).parse()
 
 
 def load_file(path: StrPath) -> tuple[RecordItem, ...]:
     """Deserialize a given file path into a sequence of records."""
-    with pathlib.Path(path).open("rb") as f:
-        return load_stream(f)
+    with pathlib.Path(path).open("rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        offset = 0
+
+        while offset < size:
+            count = f.readinto(view[offset:])
+
+            if not count:
+                break
+
+            offset += count
+
+        # Files that report no size, or grew since the stat, have more.
+        rest = f.read()
+
+    if rest:
+        return load_bytes(bytes(view[:offset]) + rest)
+
+    return load_bytes(view[:offset])
+
+
+def load_string_table(
+    data: Buffer,
+) -> tuple[array.array[int], array.array[int], bytes]:
+    """Deserialize the string records of a buffer into flat arrays.
+
+    Returns the object IDs, the offsets of each string in the blob of
+    concatenated UTF-8 payloads (plus a trailing end offset), and the blob
+    itself. String `i` is `blob[offsets[i]:offsets[i + 1]]`. No record
+    objects are created, and other records are skipped.
+    """
+    buf = memoryview(data).cast("B")
+    size = len(buf)
+    object_ids = array.array("i")
+    offsets = array.array("q", [0])
+    parts: list[memoryview] = []
+    total = 0
+    pos = 0
+
+    while True:
+        if pos >= size:
+            raise EOFError
+
+        record_type = buf[pos]
+        pos += 1
+
+        if record_type == 6:  # RecordTypeEnum.BinaryObjectString
+            if pos + 4 > size:
+                raise EOFError
+
+            object_ids.append(_I32.unpack_from(buf, pos)[0])
+            length, pos = _decode_leb128(buf, pos + 4)
+            end = pos + length
+
+            if end > size:
+                raise EOFError
+
+            parts.append(buf[pos:end])
+            total += length
+            offsets.append(total)
+            pos = end
+        elif record_type == 0:  # RecordTypeEnum.SerializedStreamHeader
+            pos += 16
+
+            if pos > size:
+                raise EOFError
+        elif record_type == 11:  # RecordTypeEnum.MessageEnd
+            break
+        else:
+            msg = f"{record_type} is not a valid RecordTypeEnum"
+            raise ValueError(msg)
+
+    return object_ids, offsets, b"".join(parts)
 
 
 def dump_stream(
     records: cabc.Iterable[RecordItem], stream: StreamWriter
 ) -> None:
     """Serialize a sequence of records to a writable stream."""
-    writer = RecordWriter(stream)
-
-    for record in records:
-        writer.record(record)
+    _ = stream.write(dump_bytes(records))
 
 
 def dump_bytes(records: cabc.Iterable[RecordItem]) -> bytes:
     """Serialize a sequence of records to bytes."""
-    buffer = io.BytesIO()
-    dump_stream(records, buffer)
-    return buffer.getvalue()
+    # Encode each record straight to bytes and join them once at the end,
+    # rather than going through RecordWriter per record.
+    parts: list[bytes] = []
+    append = parts.append
+    encoders = _ENCODERS
+
+    for record in records:
+        encode = encoders.get(type(record))
+
+        if encode is None:
+            encode = _lookup_record_type(encoders, record)
+
+        append(encode(record))
+
+    return b"".join(parts)
 
 
 def dump_file(records: cabc.Iterable[RecordItem], path: StrPath) -> None:
@@ -0,0 +1,46 @@
+import mini_nrbf
+
+
+def test_load_string_table_matches_load_bytes() -> None:
+    records = [
+        mini_nrbf.SerializedStreamHeader(1, -1, 1, 0),
+        mini_nrbf.BinaryObjectString(1, ""),
+        mini_nrbf.BinaryObjectString(2, "ascii"),
+        mini_nrbf.BinaryObjectString(-3, "héllo wörld €𝄞"),
+        mini_nrbf.BinaryObjectString(4, "x" * 20000),
+        mini_nrbf.MessageEnd(),
+    ]
+    data = mini_nrbf.dump_bytes(records)
+
+    object_ids, offsets, blob = mini_nrbf.load_string_table(data)
+
+    strings = [
+        record
+        for record in mini_nrbf.load_bytes(data)
+        if isinstance(record, mini_nrbf.BinaryObjectString)
+    ]
+    assert list(object_ids) == [record.object_id for record in strings]
+    assert len(offsets) == len(strings) + 1
+    assert offsets[-1] == len(blob)
+    assert [
+        blob[offsets[i] : offsets[i + 1]].decode("utf-8")
+        for i in range(len(strings))
+    ] == [record.value for record in strings]
+
+
+def test_load_string_table_rejects_truncated_input() -> None:
+    data = mini_nrbf.dump_bytes(
+        [
+            mini_nrbf.SerializedStreamHeader(1, -1, 1, 0),
+            mini_nrbf.BinaryObjectString(1, "value"),
+            mini_nrbf.MessageEnd(),
+        ]
+    )
+
+    for end in range(len(data)):
+        try:
+            mini_nrbf.load_string_table(data[:end])
+        except EOFError:
+            pass
+        else:
+            raise AssertionError(end)